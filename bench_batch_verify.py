@@ -0,0 +1,89 @@
+import sys
+import time
+
+from mldss import q, dim, random_vector, random_matrix, mat_vec_mult, sign_with_commitment, verify
+from mldss_batch import batch_pays_off, batch_rounds, batch_verify
+
+##########################################
+# Lotes de prueba y medición de tiempos  #
+##########################################
+
+def make_signature_batch(n, A, q, num_users=10):
+    # Genera n firmas válidas (m, sigma, c, u, pk) de varios usuarios
+    keys = []
+    for _ in range(num_users):
+        s = random_vector(len(A[0]), -2, 2)
+        keys.append((s, mat_vec_mult(A, s, q)))
+    items = []
+    for i in range(n):
+        s, pk = keys[i % num_users]
+        m = f"mensaje {i}"
+        sigma, c, u = sign_with_commitment(m, A, s, q)
+        items.append((m, sigma, c, u, pk))
+    return items
+
+def tamper_batch(items, A, q, every=10):
+    # Altera una de cada `every` firmas: unas en σ y otras en u (manteniendo c == f(u, m)).
+    # Con A de una sola fila solo se altera σ. Devuelve el lote y los índices modificados
+    items = list(items)
+    # Columna de A no nula: sumar 1 a esa componente de σ siempre cambia A * σ
+    cols = [j for j in range(len(A[0])) if any(row[j] % q for row in A)]
+    if not cols:
+        raise ValueError("A es nula mod q: alterar σ no cambiaría A * σ")
+    col = cols[0]
+    tampered = list(range(0, len(items), every))
+    for n, i in enumerate(tampered):
+        m, sigma, c, u, pk = items[i]
+        if n % 2 == 0 or len(u) < 2:
+            sigma = list(sigma)
+            sigma[col] = (sigma[col] + 1) % q
+        else:
+            # Se reparte el cambio para que sum(u), y por tanto c, no varíe
+            u = list(u)
+            u[0] = (u[0] + 1) % q
+            u[1] = (u[1] - 1) % q
+        items[i] = (m, sigma, c, u, pk)
+    return items, tampered
+
+def benchmark_batch_verify(sizes=(10, 100, 1000, 10000, 100000), security_bits=40,
+                           num_users=10, matrix_dim=dim):
+    # Compara verify() firma por firma con batch_verify, con un lote válido y con
+    # un lote con el 10% de las firmas alteradas
+    bench_A = random_matrix(matrix_dim, 0, 10)
+    batched = batch_pays_off(bench_A, batch_rounds(security_bits, q))
+    if not batched:
+        print(f"dim={matrix_dim}: batch_verify no combina firmas con esta dimensión, "
+              f"solo las comprueba una a una; no hay aceleración que medir")
+    results = []
+    for n in sizes:
+        valid = make_signature_batch(n, bench_A, q, num_users)
+        tampered_items, tampered = tamper_batch(valid, bench_A, q)
+        for label, items, expected in (("válido", valid, []), ("10% alterado", tampered_items, tampered)):
+            start = time.perf_counter()
+            individual = [i for i, (m, sigma, c, u, pk) in enumerate(items)
+                          if verify(m, sigma, c, bench_A, pk, q)[:2] != (True, list(u))]
+            individual_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            _, batch_invalid = batch_verify(items, bench_A, q, security_bits)
+            batch_time = time.perf_counter() - start
+
+            correct = individual == batch_invalid == expected
+            line = (f"dim={matrix_dim} n={n:>6} {label:<12} individual={individual_time:.4f}s  "
+                    f"batch_verify={batch_time:.4f}s  correcto={correct}")
+            if batched:
+                speedup = individual_time / batch_time if batch_time else float("inf")
+                line += f"  aceleración={speedup:.2f}x"
+            results.append((n, label, individual_time, batch_time, correct))
+            print(line)
+    return results
+
+if __name__ == "__main__":
+    # Uso: python bench_batch_verify.py [dimensión]
+    try:
+        bench_dim = int(sys.argv[1]) if len(sys.argv) > 1 else dim
+    except ValueError:
+        bench_dim = 0
+    if bench_dim < 1:
+        sys.exit("Uso: python bench_batch_verify.py [dimensión entera >= 1]")
+    benchmark_batch_verify(matrix_dim=bench_dim)
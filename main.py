@@ -1,5 +1,4 @@
 import sys
-import random
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QFormLayout, QLineEdit,
     QPushButton, QLabel, QMessageBox, QTabWidget, QTextEdit
@@ -12,50 +11,7 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.animation import FuncAnimation
 
-##########################################
-# Parámetros y funciones básicas MLDSS   #
-##########################################
-
-q = 23      # Módulo (número primo pequeño, solo para ejemplificar)
-dim = 2     # Dimensión de los vectores y matrices
-
-def random_vector(dim, low=-2, high=2):
-    return [random.randint(low, high) for _ in range(dim)]
-
-def random_matrix(dim, low=0, high=10):
-    return [[random.randint(low, high) for _ in range(dim)] for _ in range(dim)]
-
-def mat_vec_mult(matrix, vector, mod):
-    result = []
-    for row in matrix:
-        val = sum(x * y for x, y in zip(row, vector)) % mod
-        result.append(val)
-    return result
-
-def simple_hash(m, mod):
-    return sum(ord(c) for c in m) % mod
-
-def sign(m, A, s, q):
-    # Paso 1: Generar vector aleatorio r
-    r = random_vector(dim, -2, 2)
-    # Paso 2: Calcular u = A * r mod q
-    u = mat_vec_mult(A, r, q)
-    # Paso 3: Calcular el reto c combinando u y el hash simple del mensaje
-    c = (sum(u) + simple_hash(m, q)) % q
-    # Paso 4: Calcular la firma σ = r + c * s mod q (suma componente a componente)
-    sigma = [(r_i + c * s_i) % q for r_i, s_i in zip(r, s)]
-    return sigma, c
-
-def verify(m, sigma, c, A, pk, q):
-    # Paso 1: Calcular A * σ mod q
-    Asigma = mat_vec_mult(A, sigma, q)
-    # Paso 2: Calcular c * pk
-    cp = [(c * pk_i) % q for pk_i in pk]
-    # Paso 3: Obtener u' = A * σ - c * pk mod q
-    u_prime = [((a - b) % q) for a, b in zip(Asigma, cp)]
-    # Paso 4: Recalcular c' y comparar
-    c_prime = (sum(u_prime) + simple_hash(m, q)) % q
-    return c_prime == c, u_prime, c_prime
+from mldss import q, dim, random_vector, random_matrix, mat_vec_mult, sign, verify
 
 # Generar un parámetro público A global (simula la retícula común)
 A = random_matrix(dim, 0, 10)
@@ -0,0 +1,140 @@
+import math
+import os
+import random
+from operator import mul
+
+from mldss import mat_vec_mult, simple_hash
+
+##########################################
+# Verificación por lotes (probabilística)#
+##########################################
+
+# Por debajo de este tamaño los sub-lotes se comprueban firma por firma
+BISECTION_CUTOFF = 16
+# Firmas que se comprueban directamente antes de intentar la combinación aleatoria
+PRECHECK_SAMPLE = 32
+
+def batch_rounds(security_bits, q):
+    # Cada ronda con coeficientes aleatorios en Z_q deja pasar un lote inválido
+    # con probabilidad <= 1/q, así que se repite hasta alcanzar 2^-security_bits
+    return max(1, math.ceil(security_bits / math.log2(q)))
+
+def batch_pays_off(A, rounds):
+    # Coste estimado por firma en unidades de ~0.1 µs, medido con CPython: la
+    # combinación hace rounds * dim productos en C (sum/map) más el paso 1, y la
+    # verificación directa un producto A * σ en un generador de Python. Se exige
+    # un margen de 1.5x para no elegir el lote cuando la ganancia es ruido
+    rows, cols = len(A), len(A[0])
+    batch_cost = rounds * cols + 3 * rows + 20
+    direct_cost = rows * cols + 6 * rows + 10
+    return 1.5 * batch_cost < direct_cost
+
+def well_formed(item, A):
+    # σ, u y pk deben tener las dimensiones de A; si no, zip recortaría la comparación
+    _, sigma, _, u, pk = item
+    return len(sigma) == len(A[0]) and len(u) == len(A) and len(pk) == len(A)
+
+def relation_holds(sigma, c, u, A, pk, q):
+    # Comprueba de forma exacta A * σ - c * pk == u mod q para una sola firma
+    return mat_vec_mult(A, sigma, q) == [(c * p + u_k) % q for p, u_k in zip(pk, u)]
+
+def check_each(items, indices, A, q):
+    # Verificación directa de la relación para firmas ya validadas en el paso 1
+    return [i for i in indices
+            if not relation_holds(items[i][1], items[i][2], items[i][3], A, items[i][4], q)]
+
+def verify_each(items, A, q):
+    # Verificación directa completa en una sola pasada (mismo coste que verify())
+    invalid = []
+    for i, item in enumerate(items):
+        m, sigma, c, u, pk = item
+        if (not well_formed(item, A)
+                or (sum(u) + simple_hash(m, q)) % q != c
+                or not relation_holds(sigma, c, u, A, pk, q)):
+            invalid.append(i)
+    return invalid
+
+def batch_coefficients(count, q):
+    # Los coeficientes del lote no deben ser predecibles por quien firma, por eso
+    # se toman de os.urandom y no del Mersenne Twister de random
+    if q > 256:
+        # El sesgo de reducir 64 bits mod q es despreciable
+        return [x % q for x in memoryview(os.urandom(8 * count)).cast("Q")]
+    # Con q pequeño cada byte da un coeficiente: se descartan los bytes >= limit
+    # para que byte % q sea uniforme, y translate hace la reducción en C
+    limit = 256 - 256 % q
+    table = bytes(b % q for b in range(256))
+    discard = bytes(range(limit, 256))
+    coeffs = b""
+    while len(coeffs) < count:
+        coeffs += os.urandom(count - len(coeffs) + 16).translate(table, discard)
+    return coeffs[:count]
+
+def combined_relation_holds(items, A, q, rounds):
+    # Combinación lineal aleatoria de las relaciones, una por ronda:
+    # A * (Σ ρ_i σ_i) == Σ ρ_i (u_i + c_i * pk_i) mod q
+    n = len(items)
+    # Se trabaja por columnas para que cada suma ponderada se haga en C con sum(map(...))
+    sigma_cols = list(zip(*(sigma for _, sigma, _, _, _ in items)))
+    rhs_cols = list(zip(*([u_k + c * p for u_k, p in zip(u, pk)] for _, _, c, u, pk in items)))
+    coeffs = batch_coefficients(rounds * n, q)
+    for t in range(rounds):
+        rhos = coeffs[t * n:(t + 1) * n]
+        # Un único producto matriz-vector por ronda, independiente del tamaño del lote
+        lhs = mat_vec_mult(A, [sum(map(mul, rhos, col)) for col in sigma_cols], q)
+        if lhs != [sum(map(mul, rhos, col)) % q for col in rhs_cols]:
+            return False
+    return True
+
+def find_invalid(items, indices, A, q, rounds):
+    # Bisección sobre un sub-lote cuya comprobación combinada ya ha fallado
+    if len(indices) <= BISECTION_CUTOFF:
+        return check_each(items, indices, A, q)
+    half = len(indices) // 2
+    left, right = indices[:half], indices[half:]
+    left_ok = combined_relation_holds([items[i] for i in left], A, q, rounds)
+    right_ok = combined_relation_holds([items[i] for i in right], A, q, rounds)
+    if not left_ok and not right_ok:
+        # Hay firmas inválidas repartidas por todo el sub-lote: seguir dividiendo
+        # costaría más que comprobarlas directamente
+        return check_each(items, indices, A, q)
+    if not left_ok:
+        return find_invalid(items, left, A, q, rounds)
+    if not right_ok:
+        return find_invalid(items, right, A, q, rounds)
+    return []
+
+def batch_verify(items, A, q, security_bits=40):
+    # Cada elemento es (m, sigma, c, u, pk), con u el compromiso de sign_with_commitment.
+    # Devuelve (todas_validas, indices_invalidos). Acepta una firma solo si
+    # c == f(u, m) y u == A * σ - c * pk mod q, lo que es más estricto que verify():
+    # una firma que verify() acepta se rechaza si el u enviado no es ese valor.
+    # Con los parámetros de la aplicación (dim = 2, q = 23) nunca se combina: se
+    # verifica firma por firma. Una firma inválida pasa con probabilidad <= 2^-security_bits
+    items = list(items)
+    rounds = batch_rounds(security_bits, q)
+    if len(items) <= BISECTION_CUTOFF or not batch_pays_off(A, rounds):
+        invalid = verify_each(items, A, q)
+        return not invalid, invalid
+    invalid = []
+    pending = []
+    # Paso 1: Dimensiones correctas y reto c == f(u, m) (sin productos matriciales)
+    for i, item in enumerate(items):
+        m, _, c, u, _ = item
+        if not well_formed(item, A) or (sum(u) + simple_hash(m, q)) % q != c:
+            invalid.append(i)
+        else:
+            pending.append(i)
+    # Paso 2: Muestra comprobada directamente: si ya contiene firmas inválidas,
+    # probablemente hay muchas y la bisección costaría más que la verificación
+    # directa. La muestra solo decide el camino, no la probabilidad de error
+    sample = set(random.sample(pending, min(PRECHECK_SAMPLE, len(pending) // 8)))
+    sample_invalid = check_each(items, sorted(sample), A, q)
+    rest = [i for i in pending if i not in sample]
+    # Paso 3: Comprobar todas las relaciones A * σ - c * pk == u a la vez
+    if sample_invalid:
+        invalid.extend(sample_invalid + check_each(items, rest, A, q))
+    elif rest and not combined_relation_holds([items[i] for i in rest], A, q, rounds):
+        invalid.extend(find_invalid(items, rest, A, q, rounds))
+    invalid.sort()
+    return not invalid, invalid
@@ -0,0 +1,75 @@
+import unittest
+
+from bench_batch_verify import make_signature_batch, tamper_batch
+from mldss import q, dim, random_matrix, simple_hash, verify
+from mldss_batch import batch_pays_off, batch_rounds, batch_verify
+
+
+def expected_invalid(items, A):
+    # Referencia: verify() acepta la firma y el u enviado es A * σ - c * pk
+    invalid = []
+    for i, (m, sigma, c, u, pk) in enumerate(items):
+        ok, u_prime, _ = verify(m, sigma, c, A, pk, q)
+        if not (ok and u_prime == list(u)):
+            invalid.append(i)
+    return invalid
+
+
+class BatchVerifyTest(unittest.TestCase):
+    def setUp(self):
+        # A de la aplicación (camino directo) y una A grande (combinación y bisección)
+        self.small_A = random_matrix(dim, 1, 10)
+        self.large_A = random_matrix(32, 0, 10)
+        self.assertFalse(batch_pays_off(self.small_A, batch_rounds(40, q)))
+        self.assertTrue(batch_pays_off(self.large_A, batch_rounds(40, q)))
+
+    def test_empty_batch(self):
+        self.assertEqual(batch_verify([], self.small_A, q), (True, []))
+
+    def test_valid_batches(self):
+        for A in (self.small_A, self.large_A):
+            items = make_signature_batch(200, A, q)
+            self.assertEqual(batch_verify(items, A, q), (True, []))
+
+    def test_rejects_exactly_tampered(self):
+        # Pocas firmas alteradas (bisección) y muchas (vuelta a la verificación directa)
+        for A in (self.small_A, self.large_A):
+            valid = make_signature_batch(200, A, q)
+            for every in (100, 40, 10, 2):
+                with self.subTest(dim=len(A), every=every):
+                    items, tampered = tamper_batch(valid, A, q, every)
+                    self.assertEqual(expected_invalid(items, A), tampered)
+                    self.assertEqual(batch_verify(items, A, q), (False, tampered))
+
+    def test_rejects_truncated_u(self):
+        # Con u vacío o recortado zip acortaba la comparación y la firma pasaba
+        pk = [1, 2]
+        m = "login challenge"
+        forged = (m, [5, 7], simple_hash(m, q), [], pk)
+        self.assertEqual(batch_verify([forged], self.small_A, q), (False, [0]))
+        items = make_signature_batch(100, self.large_A, q)
+        m, sigma, c, u, pk = items[7]
+        items[7] = (m, sigma, (sum(u[:-1]) + simple_hash(m, q)) % q, u[:-1], pk)
+        self.assertEqual(batch_verify(items, self.large_A, q), (False, [7]))
+
+    def test_rejects_wrong_lengths_without_crashing(self):
+        items = make_signature_batch(100, self.large_A, q)
+        m, sigma, c, u, pk = items[3]
+        items[3] = (m, sigma, (sum(u) + simple_hash(m, q)) % q, list(u) + [0], pk)
+        m, sigma, c, u, pk = items[50]
+        items[50] = (m, sigma[:-1], c, u, pk)
+        m, sigma, c, u, pk = items[90]
+        items[90] = (m, sigma, c, u, pk[:-1])
+        self.assertEqual(batch_verify(items, self.large_A, q), (False, [3, 50, 90]))
+
+    def test_tamper_batch_guards(self):
+        one_row = [[3]]
+        items, tampered = tamper_batch(make_signature_batch(20, one_row, q), one_row, q, 5)
+        self.assertEqual(batch_verify(items, one_row, q), (False, tampered))
+        zero = [[0, 0], [0, 0]]
+        with self.assertRaises(ValueError):
+            tamper_batch(make_signature_batch(4, zero, q), zero, q)
+
+
+if __name__ == "__main__":
+    unittest.main()